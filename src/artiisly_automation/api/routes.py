@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 from fastapi import APIRouter, Depends, HTTPException, status
 
@@ -9,6 +10,7 @@ from artiisly_automation.connectors.mock_adapters import (
     MockSalesChannelAdapter,
     MockSocialPublisher,
 )
+from artiisly_automation.connectors.http_client import AsyncJsonHttpClient, HttpPoolConfig
 from artiisly_automation.connectors.production_adapters import (
     JsonHttpClient,
     PrintifyAdapter,
@@ -29,6 +31,22 @@ router = APIRouter(tags=["automation"])
 
 repository = InMemoryTaskRepository()
 
+# Global cap on in-flight channel/social calls across all workflows in this process.
+step_executor = ThreadPoolExecutor(
+    max_workers=int(os.getenv("ARTIISLY_AUTOMATION_STEP_WORKERS", "32")),
+    thread_name_prefix="artiisly-step",
+)
+workflow_concurrency = int(os.getenv("ARTIISLY_AUTOMATION_WORKFLOW_CONCURRENCY", "8"))
+
+# Keep-alive connection pools shared by every workflow's outbound provider calls.
+http_pool = AsyncJsonHttpClient(
+    HttpPoolConfig(
+        max_connections_per_host=int(os.getenv("ARTIISLY_HTTP_MAX_CONNECTIONS_PER_HOST", "10")),
+        connect_timeout_seconds=float(os.getenv("ARTIISLY_HTTP_CONNECT_TIMEOUT", "5")),
+        read_timeout_seconds=float(os.getenv("ARTIISLY_HTTP_READ_TIMEOUT", "20")),
+    )
+)
+
 
 def _build_orchestrator(payload: AutomationRequest) -> AutomationOrchestrator:
     channel_adapters = {
@@ -39,7 +57,7 @@ def _build_orchestrator(payload: AutomationRequest) -> AutomationOrchestrator:
     }
 
     dry_run = os.getenv("ARTIISLY_AUTOMATION_DRY_RUN", "true").lower() != "false"
-    client = JsonHttpClient(dry_run=dry_run)
+    client = JsonHttpClient(dry_run=dry_run, http=http_pool)
 
     if (
         payload.integrations.woocommerce_base_url
@@ -71,6 +89,8 @@ def _build_orchestrator(payload: AutomationRequest) -> AutomationOrchestrator:
         channel_adapters=channel_adapters,
         social_publishers=social_publishers,
         repository=repository,
+        executor=step_executor,
+        max_parallel_steps=workflow_concurrency,
     )
 
 
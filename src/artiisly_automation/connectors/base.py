@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
 
+from artiisly_automation.connectors.aio import run_sync
 from artiisly_automation.core.models import (
     GeneratedProduct,
     ProductInput,
@@ -29,3 +31,73 @@ class SocialPublisher(ABC):
     @abstractmethod
     def post(self, caption: str, media_url: str) -> SocialPostResult:
         raise NotImplementedError
+
+
+# Async connectors implement the ``*_async`` coroutine and inherit a blocking
+# sync method that runs it on the shared connector loop, so they can be handed
+# to anything that expects the sync interfaces above.
+
+
+class AsyncDesignEngine(DesignEngine):
+    @abstractmethod
+    async def generate_async(self, payload: ProductInput) -> GeneratedProduct:
+        raise NotImplementedError
+
+    def generate(self, payload: ProductInput) -> GeneratedProduct:
+        return run_sync(self.generate_async(payload))
+
+
+class AsyncSalesChannelAdapter(SalesChannelAdapter):
+    @abstractmethod
+    async def publish_async(self, product: GeneratedProduct, payload: ProductInput) -> PublishResult:
+        raise NotImplementedError
+
+    def publish(self, product: GeneratedProduct, payload: ProductInput) -> PublishResult:
+        return run_sync(self.publish_async(product, payload))
+
+
+class AsyncSocialPublisher(SocialPublisher):
+    @abstractmethod
+    async def post_async(self, caption: str, media_url: str) -> SocialPostResult:
+        raise NotImplementedError
+
+    def post(self, caption: str, media_url: str) -> SocialPostResult:
+        return run_sync(self.post_async(caption=caption, media_url=media_url))
+
+
+# Shims exposing existing sync connectors through the async interfaces. Calls
+# run in a worker thread so blocking implementations never stall the loop.
+
+
+class ThreadedDesignEngine(AsyncDesignEngine):
+    def __init__(self, engine: DesignEngine) -> None:
+        self.engine = engine
+
+    async def generate_async(self, payload: ProductInput) -> GeneratedProduct:
+        return await asyncio.to_thread(self.engine.generate, payload)
+
+    def generate(self, payload: ProductInput) -> GeneratedProduct:
+        return self.engine.generate(payload)
+
+
+class ThreadedSalesChannelAdapter(AsyncSalesChannelAdapter):
+    def __init__(self, adapter: SalesChannelAdapter) -> None:
+        self.adapter = adapter
+
+    async def publish_async(self, product: GeneratedProduct, payload: ProductInput) -> PublishResult:
+        return await asyncio.to_thread(self.adapter.publish, product, payload)
+
+    def publish(self, product: GeneratedProduct, payload: ProductInput) -> PublishResult:
+        return self.adapter.publish(product, payload)
+
+
+class ThreadedSocialPublisher(AsyncSocialPublisher):
+    def __init__(self, publisher: SocialPublisher) -> None:
+        self.publisher = publisher
+        self.platform = publisher.platform
+
+    async def post_async(self, caption: str, media_url: str) -> SocialPostResult:
+        return await asyncio.to_thread(self.publisher.post, caption, media_url)
+
+    def post(self, caption: str, media_url: str) -> SocialPostResult:
+        return self.publisher.post(caption, media_url)
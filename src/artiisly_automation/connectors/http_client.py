@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import ssl
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any
+from urllib.parse import urlsplit
+
+from artiisly_automation.connectors.aio import run_on_background_loop
+
+
+class HttpStatusError(Exception):
+    def __init__(self, status: int, url: str, headers: dict[str, str], body: bytes) -> None:
+        super().__init__(f"HTTP {status} from {url}")
+        self.status = status
+        self.url = url
+        self.headers = headers
+        self.body = body
+
+
+class _StaleConnection(ConnectionError):
+    pass
+
+
+@dataclass(frozen=True)
+class HttpPoolConfig:
+    max_connections_per_host: int = 10
+    connect_timeout_seconds: float = 5.0
+    read_timeout_seconds: float = 20.0
+    keepalive_expiry_seconds: float = 30.0
+
+
+@dataclass
+class HttpResponse:
+    status: int
+    headers: dict[str, str]
+    body: bytes
+
+    def json(self) -> Any:
+        return json.loads(self.body.decode("utf-8")) if self.body else {}
+
+
+@dataclass
+class _Connection:
+    reader: asyncio.StreamReader
+    writer: asyncio.StreamWriter
+    last_used: float = field(default_factory=time.monotonic)
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+class _HostPool:
+    def __init__(self, scheme: str, host: str, port: int, config: HttpPoolConfig) -> None:
+        self.scheme = scheme
+        self.host = host
+        self.port = port
+        self.config = config
+        self.idle: deque[_Connection] = deque()
+        self.slots = asyncio.Semaphore(config.max_connections_per_host)
+        self.opened = 0
+
+    def take_idle(self) -> _Connection | None:
+        now = time.monotonic()
+        while self.idle:
+            connection = self.idle.pop()
+            if now - connection.last_used < self.config.keepalive_expiry_seconds and not connection.reader.at_eof():
+                return connection
+            connection.close()
+        return None
+
+    async def connect(self) -> _Connection:
+        ssl_context = ssl.create_default_context() if self.scheme == "https" else None
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(self.host, self.port, ssl=ssl_context),
+            timeout=self.config.connect_timeout_seconds,
+        )
+        self.opened += 1
+        return _Connection(reader, writer)
+
+    def release(self, connection: _Connection, reusable: bool) -> None:
+        if reusable:
+            connection.last_used = time.monotonic()
+            self.idle.append(connection)
+        else:
+            connection.close()
+
+    def close(self) -> None:
+        while self.idle:
+            self.idle.pop().close()
+
+
+class AsyncJsonHttpClient:
+    """HTTP/1.1 JSON client with per-host keep-alive connection pools.
+
+    All I/O runs on the shared connector loop so the pools can be reused from
+    sync code, worker threads and any caller event loop alike.
+    """
+
+    def __init__(self, config: HttpPoolConfig | None = None) -> None:
+        self.config = config or HttpPoolConfig()
+        self._pools: dict[tuple[str, str, int], _HostPool] = {}
+
+    @property
+    def connections_opened(self) -> int:
+        return sum(pool.opened for pool in self._pools.values())
+
+    async def post(self, url: str, payload: dict, headers: dict[str, str]) -> dict:
+        response = await self.request("POST", url, payload=payload, headers=headers)
+        return response.json()
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        payload: Any = None,
+        headers: dict[str, str] | None = None,
+    ) -> HttpResponse:
+        body = json.dumps(payload).encode("utf-8") if payload is not None else b""
+        response = await run_on_background_loop(self._send(method, url, body, headers or {}))
+        if response.status >= 400:
+            raise HttpStatusError(response.status, url, response.headers, response.body)
+        return response
+
+    async def aclose(self) -> None:
+        await run_on_background_loop(self._close_pools())
+
+    async def _close_pools(self) -> None:
+        for pool in self._pools.values():
+            pool.close()
+        self._pools.clear()
+
+    def _pool_for(self, url: str) -> tuple[_HostPool, str, str]:
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise ValueError(f"Unsupported URL: {url}")
+        port = parts.port or (443 if parts.scheme == "https" else 80)
+        key = (parts.scheme, parts.hostname, port)
+        pool = self._pools.get(key)
+        if pool is None:
+            pool = self._pools[key] = _HostPool(parts.scheme, parts.hostname, port, self.config)
+        default_port = 443 if parts.scheme == "https" else 80
+        host_header = parts.hostname if port == default_port else f"{parts.hostname}:{port}"
+        target = parts.path or "/"
+        if parts.query:
+            target = f"{target}?{parts.query}"
+        return pool, host_header, target
+
+    async def _send(self, method: str, url: str, body: bytes, headers: dict[str, str]) -> HttpResponse:
+        pool, host_header, target = self._pool_for(url)
+        head = [f"{method} {target} HTTP/1.1", f"Host: {host_header}", f"Content-Length: {len(body)}"]
+        head.extend(f"{name}: {value}" for name, value in headers.items() if name.lower() not in ("host", "content-length"))
+        raw = ("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + body
+
+        async with pool.slots:
+            connection = pool.take_idle()
+            reused = connection is not None
+            if connection is None:
+                connection = await pool.connect()
+            try:
+                response, reusable = await self._exchange(connection, raw)
+            except _StaleConnection:
+                connection.close()
+                # A pooled connection the server already closed fails before any
+                # response bytes arrive; retry once on a fresh connection.
+                if not reused:
+                    raise
+                connection = await pool.connect()
+                try:
+                    response, reusable = await self._exchange(connection, raw)
+                except BaseException:
+                    connection.close()
+                    raise
+            except BaseException:
+                connection.close()
+                raise
+            pool.release(connection, reusable)
+            return response
+
+    async def _exchange(self, connection: _Connection, raw: bytes) -> tuple[HttpResponse, bool]:
+        try:
+            connection.writer.write(raw)
+            await connection.writer.drain()
+        except ConnectionError as exc:
+            raise _StaleConnection(str(exc)) from exc
+        return await asyncio.wait_for(_read_response(connection.reader), timeout=self.config.read_timeout_seconds)
+
+
+async def _read_response(reader: asyncio.StreamReader) -> tuple[HttpResponse, bool]:
+    status_line = await reader.readline()
+    if not status_line:
+        raise _StaleConnection("connection closed before response")
+    version, status, *_ = status_line.decode("latin-1").split(" ", 2)
+    headers: dict[str, str] = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    status_code = int(status)
+    keep_alive = version.upper() == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+    if status_code in (204, 304) or 100 <= status_code < 200:
+        body = b""
+    elif "chunked" in headers.get("transfer-encoding", "").lower():
+        body = await _read_chunked(reader)
+    elif "content-length" in headers:
+        body = await reader.readexactly(int(headers["content-length"]))
+    else:
+        body = await reader.read()
+        keep_alive = False
+    return HttpResponse(status=status_code, headers=headers, body=body), keep_alive
+
+
+async def _read_chunked(reader: asyncio.StreamReader) -> bytes:
+    chunks = []
+    while True:
+        size = int((await reader.readline()).split(b";", 1)[0].strip(), 16)
+        if size == 0:
+            while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                pass
+            return b"".join(chunks)
+        chunks.append(await reader.readexactly(size))
+        await reader.readexactly(2)
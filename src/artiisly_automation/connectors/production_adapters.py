@@ -1,12 +1,12 @@
 from __future__ import annotations
 
 import base64
-import json
 import uuid
-import urllib.request
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
-from artiisly_automation.connectors.base import SalesChannelAdapter, SocialPublisher
+from artiisly_automation.connectors.aio import run_sync
+from artiisly_automation.connectors.base import AsyncSalesChannelAdapter, AsyncSocialPublisher
+from artiisly_automation.connectors.http_client import AsyncJsonHttpClient, HttpPoolConfig
 from artiisly_automation.core.models import (
     Channel,
     GeneratedProduct,
@@ -21,18 +21,28 @@ from artiisly_automation.core.models import (
 class JsonHttpClient:
     timeout_seconds: int = 20
     dry_run: bool = True
+    http: AsyncJsonHttpClient | None = field(default=None, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.http is None:
+            self.http = AsyncJsonHttpClient(HttpPoolConfig(read_timeout_seconds=self.timeout_seconds))
+
+    async def post_async(self, url: str, payload: dict, headers: dict[str, str]) -> dict:
+        if self.dry_run:
+            return self._dry_run_response(url)
+        return await self.http.post(url, payload, headers)
 
     def post(self, url: str, payload: dict, headers: dict[str, str]) -> dict:
         if self.dry_run:
-            return {"id": f"dry_{uuid.uuid4().hex[:8]}", "permalink": f"{url}/dry-run"}
+            return self._dry_run_response(url)
+        return run_sync(self.http.post(url, payload, headers))
 
-        body = json.dumps(payload).encode("utf-8")
-        request = urllib.request.Request(url=url, data=body, headers=headers, method="POST")
-        with urllib.request.urlopen(request, timeout=self.timeout_seconds) as response:
-            return json.loads(response.read().decode("utf-8"))
+    @staticmethod
+    def _dry_run_response(url: str) -> dict:
+        return {"id": f"dry_{uuid.uuid4().hex[:8]}", "permalink": f"{url}/dry-run"}
 
 
-class WooCommerceAdapter(SalesChannelAdapter):
+class WooCommerceAdapter(AsyncSalesChannelAdapter):
     def __init__(
         self,
         base_url: str,
@@ -46,10 +56,10 @@ class WooCommerceAdapter(SalesChannelAdapter):
         self.consumer_secret = consumer_secret
         self.client = client
 
-    def publish(self, product: GeneratedProduct, payload: ProductInput) -> PublishResult:
+    async def publish_async(self, product: GeneratedProduct, payload: ProductInput) -> PublishResult:
         token = base64.b64encode(f"{self.consumer_key}:{self.consumer_secret}".encode("utf-8")).decode("utf-8")
         endpoint = f"{self.base_url}/wp-json/wc/v3/products"
-        response = self.client.post(
+        response = await self.client.post_async(
             endpoint,
             payload={
                 "name": product.title,
@@ -68,16 +78,16 @@ class WooCommerceAdapter(SalesChannelAdapter):
         return PublishResult(channel=self.channel, listing_id=listing_id, status="published", listing_url=listing_url)
 
 
-class PrintifyAdapter(SalesChannelAdapter):
+class PrintifyAdapter(AsyncSalesChannelAdapter):
     def __init__(self, shop_id: str, api_token: str, client: JsonHttpClient) -> None:
         self.channel = Channel.printify
         self.shop_id = shop_id
         self.api_token = api_token
         self.client = client
 
-    def publish(self, product: GeneratedProduct, payload: ProductInput) -> PublishResult:
+    async def publish_async(self, product: GeneratedProduct, payload: ProductInput) -> PublishResult:
         endpoint = f"https://api.printify.com/v1/shops/{self.shop_id}/products.json"
-        response = self.client.post(
+        response = await self.client.post_async(
             endpoint,
             payload={
                 "title": product.title,
@@ -99,14 +109,14 @@ class PrintifyAdapter(SalesChannelAdapter):
         )
 
 
-class SocialWebhookPublisher(SocialPublisher):
+class SocialWebhookPublisher(AsyncSocialPublisher):
     def __init__(self, platform: SocialPlatform, webhook_url: str, client: JsonHttpClient) -> None:
         self.platform = platform
         self.webhook_url = webhook_url
         self.client = client
 
-    def post(self, caption: str, media_url: str) -> SocialPostResult:
-        response = self.client.post(
+    async def post_async(self, caption: str, media_url: str) -> SocialPostResult:
+        response = await self.client.post_async(
             self.webhook_url,
             payload={"platform": self.platform.value, "caption": caption, "media_url": media_url},
             headers={"Content-Type": "application/json"},
@@ -1,14 +1,21 @@
 from __future__ import annotations
 
 import uuid
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
+from functools import partial
+from typing import Any, Callable
 
 from artiisly_automation.connectors.base import DesignEngine, SalesChannelAdapter, SocialPublisher
 from artiisly_automation.core.models import (
     AutomationRequest,
     AutomationResult,
     Channel,
+    GeneratedProduct,
+    PublishResult,
     RevenuePlan,
     SocialPlatform,
+    SocialPostResult,
     TaskRecord,
     TaskState,
 )
@@ -22,11 +29,19 @@ class AutomationOrchestrator:
         channel_adapters: dict[Channel, SalesChannelAdapter],
         social_publishers: dict[SocialPlatform, SocialPublisher],
         repository: InMemoryTaskRepository,
+        executor: Executor | None = None,
+        max_parallel_steps: int = 8,
     ) -> None:
+        if max_parallel_steps < 1:
+            raise ValueError("max_parallel_steps must be at least 1")
         self.design_engine = design_engine
         self.channel_adapters = channel_adapters
         self.social_publishers = social_publishers
         self.repository = repository
+        # A shared executor bounds step concurrency across every workflow using it;
+        # max_parallel_steps bounds how many of those slots a single workflow may hold.
+        self.executor = executor
+        self.max_parallel_steps = max_parallel_steps
 
     def run(self, payload: AutomationRequest) -> TaskRecord:
         workflow_id = f"wrk_{uuid.uuid4().hex[:12]}"
@@ -34,29 +49,14 @@ class AutomationOrchestrator:
         self.repository.save(task)
 
         try:
+            adapters = [self._adapter_for(channel) for channel in payload.product.target_channels]
+            publishers = [self._publisher_for(platform) for platform in payload.social.platforms]
+
             generated_product = self.design_engine.generate(payload.product)
-            publications = []
-            for channel in payload.product.target_channels:
-                adapter = self.channel_adapters.get(channel)
-                if adapter is None:
-                    raise ValueError(f"Unsupported channel requested: {channel.value}")
-                publications.append(adapter.publish(generated_product, payload.product))
-
-            primary_listing = publications[0].listing_url if publications else generated_product.design_url
-            social_posts = []
-            for platform in payload.social.platforms:
-                publisher = self.social_publishers.get(platform)
-                if publisher is None:
-                    raise ValueError(f"Unsupported social platform requested: {platform.value}")
-
-                caption = payload.social.caption_template.format(
-                    title=generated_product.title,
-                    listing_url=primary_listing,
-                )
-                if payload.social.hashtags:
-                    caption = f"{caption} {' '.join(payload.social.hashtags)}"
-
-                social_posts.append(publisher.post(caption=caption, media_url=generated_product.design_url))
+            if self.executor is None:
+                publications, social_posts = self._run_sequentially(payload, generated_product, adapters, publishers)
+            else:
+                publications, social_posts = self._run_concurrently(payload, generated_product, adapters, publishers)
 
             revenue_plan = RevenuePlan(
                 ad_campaign_seed_keywords=[payload.product.niche, payload.product.title],
@@ -79,3 +79,93 @@ class AutomationOrchestrator:
 
     def get(self, workflow_id: str) -> TaskRecord | None:
         return self.repository.get(workflow_id)
+
+    def _adapter_for(self, channel: Channel) -> SalesChannelAdapter:
+        adapter = self.channel_adapters.get(channel)
+        if adapter is None:
+            raise ValueError(f"Unsupported channel requested: {channel.value}")
+        return adapter
+
+    def _publisher_for(self, platform: SocialPlatform) -> SocialPublisher:
+        publisher = self.social_publishers.get(platform)
+        if publisher is None:
+            raise ValueError(f"Unsupported social platform requested: {platform.value}")
+        return publisher
+
+    @staticmethod
+    def _caption(payload: AutomationRequest, generated_product: GeneratedProduct, listing_url: str) -> str:
+        caption = payload.social.caption_template.format(
+            title=generated_product.title,
+            listing_url=listing_url,
+        )
+        if payload.social.hashtags:
+            caption = f"{caption} {' '.join(payload.social.hashtags)}"
+        return caption
+
+    def _run_sequentially(
+        self,
+        payload: AutomationRequest,
+        generated_product: GeneratedProduct,
+        adapters: list[SalesChannelAdapter],
+        publishers: list[SocialPublisher],
+    ) -> tuple[list[PublishResult], list[SocialPostResult]]:
+        publications = [adapter.publish(generated_product, payload.product) for adapter in adapters]
+
+        primary_listing = publications[0].listing_url if publications else generated_product.design_url
+        social_posts = [
+            publisher.post(
+                caption=self._caption(payload, generated_product, primary_listing),
+                media_url=generated_product.design_url,
+            )
+            for publisher in publishers
+        ]
+        return publications, social_posts
+
+    def _run_concurrently(
+        self,
+        payload: AutomationRequest,
+        generated_product: GeneratedProduct,
+        adapters: list[SalesChannelAdapter],
+        publishers: list[SocialPublisher],
+    ) -> tuple[list[PublishResult], list[SocialPostResult]]:
+        assert self.executor is not None
+        publications: list[Any] = [None] * len(adapters)
+        social_posts: list[Any] = [None] * len(publishers)
+        ready: deque[tuple[str, int, Callable[[], Any]]] = deque(
+            ("channel", index, partial(adapter.publish, generated_product, payload.product))
+            for index, adapter in enumerate(adapters)
+        )
+
+        def queue_social_posts(listing_url: str) -> None:
+            caption = self._caption(payload, generated_product, listing_url)
+            ready.extend(
+                ("social", index, partial(publisher.post, caption=caption, media_url=generated_product.design_url))
+                for index, publisher in enumerate(publishers)
+            )
+
+        # Social posts only depend on the primary listing URL, so they start as soon
+        # as the first channel is published instead of waiting for every channel.
+        if not adapters:
+            queue_social_posts(generated_product.design_url)
+
+        in_flight: dict[Future[Any], tuple[str, int]] = {}
+        try:
+            while ready or in_flight:
+                while ready and len(in_flight) < self.max_parallel_steps:
+                    kind, index, call = ready.popleft()
+                    in_flight[self.executor.submit(call)] = (kind, index)
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    kind, index = in_flight.pop(future)
+                    if kind == "channel":
+                        publications[index] = future.result()
+                        if index == 0:
+                            queue_social_posts(publications[0].listing_url)
+                    else:
+                        social_posts[index] = future.result()
+        finally:
+            for future in in_flight:
+                future.cancel()
+
+        return publications, social_posts
@@ -0,0 +1,75 @@
+import asyncio
+
+import pytest
+
+from artiisly_automation.connectors.base import ThreadedSalesChannelAdapter
+from artiisly_automation.connectors.http_client import AsyncJsonHttpClient, HttpPoolConfig, HttpStatusError
+from artiisly_automation.connectors.mock_adapters import MockArtislyDesignEngine, MockSalesChannelAdapter
+from artiisly_automation.connectors.production_adapters import JsonHttpClient, WooCommerceAdapter
+from artiisly_automation.core.models import Channel, ProductInput
+
+from http_standin import StandInServer
+
+
+def _product_input() -> ProductInput:
+    return ProductInput(
+        title="Botanical Hoodie",
+        niche="nature",
+        style_prompt="Bold botanical design with modern typography for hoodie print.",
+        target_channels=[Channel.woocommerce],
+        base_price=29.99,
+    )
+
+
+def test_sync_client_reuses_keep_alive_connection() -> None:
+    with StandInServer() as server:
+        client = JsonHttpClient(dry_run=False)
+        responses = [client.post(f"{server.url}/hooks", {"n": n}, {"Content-Type": "application/json"}) for n in range(5)]
+
+    assert [response["received"]["n"] for response in responses] == list(range(5))
+    assert server.connections == 1
+    assert client.http.connections_opened == 1
+
+
+def test_async_client_caps_connections_per_host() -> None:
+    http = AsyncJsonHttpClient(HttpPoolConfig(max_connections_per_host=2))
+
+    async def burst() -> list[dict]:
+        return await asyncio.gather(*(http.post(f"{server.url}/hooks", {"n": n}, {}) for n in range(20)))
+
+    with StandInServer() as server:
+        responses = asyncio.run(burst())
+
+    assert len(responses) == 20
+    assert server.connections <= 2
+
+
+def test_error_status_raises() -> None:
+    with StandInServer(lambda path, body: (429, {"message": "slow down"})) as server:
+        client = JsonHttpClient(dry_run=False)
+        with pytest.raises(HttpStatusError) as info:
+            client.post(f"{server.url}/hooks", {}, {})
+
+    assert info.value.status == 429
+
+
+def test_woocommerce_adapter_sync_shim_and_async_path() -> None:
+    engine = MockArtislyDesignEngine()
+    payload = _product_input()
+    with StandInServer() as server:
+        adapter = WooCommerceAdapter(server.url, "ck", "cs", JsonHttpClient(dry_run=False))
+        synced = adapter.publish(engine.generate(payload), payload)
+        awaited = asyncio.run(adapter.publish_async(engine.generate(payload), payload))
+
+    assert synced.channel == Channel.woocommerce
+    assert awaited.listing_url == "https://standin.local/wp-json/wc/v3/products"
+    assert [request[0] for request in server.requests] == ["/wp-json/wc/v3/products"] * 2
+    assert server.requests[0][1]["Authorization"].startswith("Basic ")
+    assert server.connections == 1
+
+
+def test_threaded_shim_exposes_sync_adapter_as_async() -> None:
+    payload = _product_input()
+    adapter = ThreadedSalesChannelAdapter(MockSalesChannelAdapter(Channel.pod))
+    result = asyncio.run(adapter.publish_async(MockArtislyDesignEngine().generate(payload), payload))
+    assert result.channel == Channel.pod
@@ -1,4 +1,7 @@
+import threading
+import time
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 
 from artiisly_automation.connectors.mock_adapters import (
     MockArtislyDesignEngine,
@@ -8,8 +11,10 @@ from artiisly_automation.connectors.mock_adapters import (
 from artiisly_automation.core.models import (
     AutomationRequest,
     Channel,
+    GeneratedProduct,
     IntegrationConfig,
     ProductInput,
+    PublishResult,
     SocialPlatform,
     SocialPostRequest,
     TaskState,
@@ -50,5 +55,94 @@ class OrchestratorTest(unittest.TestCase):
         self.assertEqual(len(result.result.social_posts), 1)
 
 
+class SlowSalesChannelAdapter(MockSalesChannelAdapter):
+    def __init__(self, channel: Channel, delay: float, tracker: "ConcurrencyTracker") -> None:
+        super().__init__(channel)
+        self.delay = delay
+        self.tracker = tracker
+
+    def publish(self, product: GeneratedProduct, payload: ProductInput) -> PublishResult:
+        with self.tracker:
+            time.sleep(self.delay)
+        return super().publish(product, payload)
+
+
+class ConcurrencyTracker:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+
+    def __enter__(self) -> None:
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+
+    def __exit__(self, *exc: object) -> None:
+        with self._lock:
+            self.active -= 1
+
+
+class ConcurrentOrchestratorTest(unittest.TestCase):
+    channels = [Channel.pod, Channel.website, Channel.marketplace, Channel.social_commerce]
+
+    def _request(self) -> AutomationRequest:
+        return AutomationRequest(
+            product=ProductInput(
+                title="Geometric Fox Tee",
+                niche="animals",
+                style_prompt="Minimal geometric fox artwork with warm tones for a t-shirt front print.",
+                target_channels=self.channels,
+                base_price=21.0,
+            ),
+            social=SocialPostRequest(platforms=[SocialPlatform.instagram, SocialPlatform.x]),
+        )
+
+    def _orchestrator(self, executor: ThreadPoolExecutor, tracker: ConcurrencyTracker, **kwargs) -> AutomationOrchestrator:
+        return AutomationOrchestrator(
+            design_engine=MockArtislyDesignEngine(),
+            channel_adapters={channel: SlowSalesChannelAdapter(channel, 0.2, tracker) for channel in self.channels},
+            social_publishers={platform: MockSocialPublisher(platform) for platform in SocialPlatform},
+            repository=InMemoryTaskRepository(),
+            executor=executor,
+            **kwargs,
+        )
+
+    def test_channels_publish_in_parallel_and_keep_order(self) -> None:
+        tracker = ConcurrencyTracker()
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            started = time.perf_counter()
+            result = self._orchestrator(executor, tracker).run(self._request())
+            elapsed = time.perf_counter() - started
+
+        self.assertEqual(result.state, TaskState.complete)
+        self.assertLess(elapsed, 0.6)
+        self.assertEqual([p.channel for p in result.result.channel_publications], self.channels)
+        self.assertEqual(
+            [p.platform for p in result.result.social_posts],
+            [SocialPlatform.instagram, SocialPlatform.x],
+        )
+
+    def test_per_workflow_limit_bounds_parallel_steps(self) -> None:
+        tracker = ConcurrencyTracker()
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            result = self._orchestrator(executor, tracker, max_parallel_steps=2).run(self._request())
+
+        self.assertEqual(result.state, TaskState.complete)
+        self.assertEqual(tracker.peak, 2)
+
+    def test_unsupported_channel_fails_before_generation(self) -> None:
+        orchestrator = AutomationOrchestrator(
+            design_engine=MockArtislyDesignEngine(),
+            channel_adapters={},
+            social_publishers={},
+            repository=InMemoryTaskRepository(),
+            executor=ThreadPoolExecutor(max_workers=2),
+        )
+        result = orchestrator.run(self._request())
+        self.assertEqual(result.state, TaskState.failed)
+        self.assertEqual(result.error, "Unsupported channel requested: pod")
+
+
 if __name__ == "__main__":
     unittest.main()